@@ -39,6 +39,14 @@ releases yet.
 
 .. _tarball: https://github.com/smarnach/pyexiftool/tarball/master
 
+If the orjson_ or the msgspec_ package is installed, it is used to
+parse the JSON output of ``exiftool``, which is considerably faster
+than the standard library's :py:mod:`json` module for large batches
+of files.
+
+.. _orjson: https://github.com/ijl/orjson
+.. _msgspec: https://github.com/jcrist/msgspec
+
 PyExifTool is licenced under GNU GPL version 3 or later.
 
 Example usage::
@@ -61,11 +69,30 @@ import os
 import json
 import warnings
 import codecs
-
-try:        # Py3k compatibility
-    basestring
-except NameError:
-    basestring = (bytes, str)
+import collections
+import itertools
+import multiprocessing
+import threading
+import tempfile
+
+# Byte and Unicode string types.  Thanks to unicode_literals, type("")
+# is unicode on Python 2.x and str on Python 3.x.
+_string_types = (bytes, type(""))
+
+try:        # Use orjson or msgspec for parsing exiftool's JSON output
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from msgspec.json import decode as _json_loads
+    except ImportError:
+        # The standard json module doesn't accept memoryview objects
+        if sys.version_info >= (3, 6):
+            # json.loads() accepts UTF-8 encoded bytes directly
+            def _json_loads(data):
+                return json.loads(data.tobytes())
+        else:
+            def _json_loads(data):
+                return json.loads(data.tobytes().decode("utf-8"))
 
 executable = "exiftool"
 """The name of the executable to run.
@@ -81,7 +108,16 @@ sentinel = b"{ready}"
 # The block size when reading from exiftool.  The standard value
 # should be fine, though other values might give better performance in
 # some cases.
-block_size = 4096
+block_size = 65536
+
+# The maximum number of files passed to exiftool in a single command by
+# the get_* methods.  Larger batches are split into several commands,
+# which limits the size of the output that has to be buffered at a
+# time.
+batch_size = 500
+
+# os.fspath() is only available in Python 3.6 and later
+_fspath = getattr(os, "fspath", None)
 
 # This code has been adapted from Lib/os.py in the Python source tree
 # (sha1 265e36e277f3)
@@ -104,14 +140,179 @@ def _fscodec():
         """
         if isinstance(filename, bytes):
             return filename
-        else:
-            return filename.encode(encoding, errors)
+        if not isinstance(filename, type("")) and _fspath is not None:
+            # Accept path-like objects such as pathlib.Path
+            filename = _fspath(filename)
+            if isinstance(filename, bytes):
+                return filename
+        return filename.encode(encoding, errors)
 
     return fsencode
 
 fsencode = _fscodec()
 del _fscodec
 
+# Cache of encoded "-<tag>" parameters, see _tag_params().
+_tag_params_cache = {}
+
+def _tag_params(tags):
+    """Return a tuple of encoded ``exiftool`` parameters requesting tags.
+
+    The parameters are cached per sequence of tags, since the same
+    tags tend to be requested over and over again.
+    """
+    tags = tuple(tags)
+    try:
+        return _tag_params_cache[tags]
+    except KeyError:
+        if len(_tag_params_cache) >= 1024:
+            _tag_params_cache.clear()
+        params = tuple(b"-" + fsencode(t) for t in tags)
+        _tag_params_cache[tags] = params
+        return params
+
+def _command(params):
+    """Return the command sending the given parameters to exiftool."""
+    if params:
+        return b"\n".join(params) + b"\n-execute\n"
+    else:
+        return b"-execute\n"
+
+def _check_not_string(arg, name):
+    """Raise ``TypeError`` if the argument is a single string.
+
+    Strings are explicitly ruled out for arguments expecting an
+    iterable of strings, because passing in a string would lead to
+    strange and hard-to-find errors.
+    """
+    if isinstance(arg, _string_types):
+        raise TypeError("The argument '%s' must be "
+                        "an iterable of strings" % name)
+
+# The maximum number of per-file results kept by ExifTool instances
+# with result caching enabled
+_cache_size = 4096
+
+def _file_state(filename):
+    """Return a key identifying the state of a file, or None if it is missing.
+
+    The key consists of the modification time, in nanoseconds where
+    available, and the file size, so that rewrites within the timestamp
+    resolution of the file system are still likely to be noticed.
+    """
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None
+    return getattr(st, "st_mtime_ns", st.st_mtime), st.st_size
+
+# Directory for temporary files; prefer a RAM-backed file system
+if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+    _temp_dir = "/dev/shm"
+else:
+    _temp_dir = None
+
+def _grow_pipe(fd):
+    """Enlarge the kernel buffer of a pipe on Linux, if permitted.
+
+    A larger buffer lets ``exiftool`` write big outputs without waiting
+    for every block to be read.  Failures are silently ignored.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        import fcntl
+        fcntl.fcntl(fd, getattr(fcntl, "F_SETPIPE_SZ", 1031), 1 << 20)
+    except (ImportError, IOError, OSError):
+        pass
+
+# The parameters selecting the levels of exiftool's -fast option
+_fast_params = ((), (b"-fast",), (b"-fast2",), (b"-fast3",), (b"-fast4",),
+                (b"-fast5",))
+
+def _fast_option(fast):
+    """Return the parameters selecting the given level of -fast."""
+    if not 0 <= fast < len(_fast_params):
+        raise ValueError("The argument 'fast' must be between 0 and %d"
+                         % (len(_fast_params) - 1))
+    return _fast_params[fast]
+
+def _tag_value(d, tag):
+    """Return the value of the only tag other than "SourceFile" in d.
+
+    The requested tag name is tried as a key first, since it is the
+    key used by exiftool if it includes the right group name.  Return
+    ``None`` if there is no such tag.
+    """
+    if tag in d and tag != "SourceFile":
+        return d[tag]
+    return next((v for k, v in d.items() if k != "SourceFile"), None)
+
+def _find_sentinel(output, begin, pos):
+    """Find the sentinel terminating the output of a command.
+
+    ``exiftool`` writes the sentinel on a line of its own; anywhere else
+    it is part of a file name or tag value.  The output of the command
+    starts at index ``begin`` of ``output``, and the search starts at
+    ``pos``.  Return a tuple with the index of the sentinel and the
+    index after its line ending, or ``-1`` and the index to resume the
+    search at once more output has been read.
+    """
+    while True:
+        end = output.find(sentinel, pos)
+        if end < 0:
+            return -1, max(pos, len(output) - len(sentinel))
+        stop = end + len(sentinel)
+        eol = output[stop:stop + 2]
+        if end > begin and output[end - 1:end] != b"\n":
+            pos = end + 1
+        elif eol[:1] == b"\n":
+            return end, stop + 1
+        elif eol == b"\r\n":
+            return end, stop + 2
+        elif eol in (b"", b"\r"):
+            # The line ending hasn't been read yet
+            return -1, end
+        else:
+            pos = end + 1
+
+def _read_block(fd):
+    """Read the next block of output from ``exiftool``."""
+    data = os.read(fd, block_size)
+    if not data:
+        raise IOError("exiftool terminated unexpectedly")
+    return data
+
+# Encoded path separators, if there is an alternative one (Windows)
+if os.altsep:
+    _separators = fsencode(os.sep), fsencode(os.altsep)
+else:
+    _separators = None
+
+def _source_key(filename):
+    """Return a key for matching a file name with a ``SourceFile`` value.
+
+    ``exiftool`` reports file names as they were given, except that it
+    uses forward slashes on Windows.  Elsewhere, a backslash is an
+    ordinary character in file names and is kept.
+    """
+    key = fsencode(filename)
+    if _separators is not None:
+        key = key.replace(*_separators)
+    return key
+
+def _index_by_source(result):
+    """Map the ``SourceFile`` keys of a JSON result to its dictionaries.
+
+    Return ``None`` if two dictionaries have the same key, so that the
+    result can't be matched to the file names unambiguously.
+    """
+    index = dict((_source_key(d.get("SourceFile", "")), d)
+                 for d in result or ())
+    if len(index) != len(result or ()):
+        return None
+    return index
+
 class ExifTool(object):
     """Run the `exiftool` command-line tool and communicate to it.
 
@@ -119,6 +320,15 @@ class ExifTool(object):
     argument to the constructor.  The default value ``exiftool`` will
     only work if the executable is in your ``PATH``.
 
+    If ``cache_results`` is true, the results of the ``get_*`` methods
+    are cached per file.  Querying a file with the same arguments again
+    returns the cached result without running ``exiftool``, unless the
+    modification time or size of the file has changed in the meantime,
+    so a batch only has to be read for its new or modified files.
+    This is useful if the same files are queried repeatedly.  Only
+    the most recently used results are kept; use
+    :py:meth:`clear_cache()` to discard them.
+
     Most methods of this class are only available after calling
     :py:meth:`start()`, which will actually launch the subprocess.  To
     avoid leaving the subprocess running, make sure to call
@@ -142,18 +352,32 @@ class ExifTool(object):
        non-existent files to any of the methods, since this will lead
        to undefied behaviour.
 
+    Every method call results in a round trip to the ``exiftool``
+    process.  When processing many files, pass all of them to one of
+    the batch methods like :py:meth:`get_metadata_batch()` instead of
+    calling the corresponding single-file method in a loop; this is
+    much faster.
+
     .. py:attribute:: running
 
        A Boolean value indicating whether this instance is currently
        associated with a running subprocess.
     """
 
-    def __init__(self, executable_=None):
+    __slots__ = ("executable", "running", "_process", "_cache", "_cwd",
+                 "__weakref__")
+
+    def __init__(self, executable_=None, cache_results=False):
         if executable_ is None:
             self.executable = executable
         else:
             self.executable = executable_
         self.running = False
+        self._cwd = None
+        if cache_results:
+            self._cache = collections.OrderedDict()
+        else:
+            self._cache = None
 
     def start(self):
         """Start an ``exiftool`` process in batch mode for this instance.
@@ -172,6 +396,9 @@ class ExifTool(object):
                  "-common_args", "-G", "-n"],
                 stdin=subprocess.PIPE, stdout=subprocess.PIPE,
                 stderr=devnull)
+        # exiftool resolves relative file names against this directory
+        self._cwd = fsencode(os.getcwd())
+        _grow_pipe(self._process.stdout.fileno())
         self.running = True
 
     def terminate(self):
@@ -197,6 +424,14 @@ class ExifTool(object):
     def __del__(self):
         self.terminate()
 
+    def clear_cache(self):
+        """Discard all cached results.
+
+        This does nothing if result caching isn't enabled.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
     def execute(self, *params):
         """Execute the given batch of parameters with ``exiftool``.
 
@@ -216,15 +451,108 @@ class ExifTool(object):
         .. note:: This is considered a low-level method, and should
            rarely be needed by application developers.
         """
+        return self._execute(*params).tobytes()
+
+    def _execute(self, *params):
+        """Execute the given batch of parameters with ``exiftool``.
+
+        This is the implementation of :py:meth:`execute()`, but the
+        output is returned as a ``memoryview`` of the buffer read from
+        ``exiftool``, so that it can be passed on without copying.
+        """
         if not self.running:
             raise ValueError("ExifTool instance not running.")
-        self._process.stdin.write(b"\n".join(params + (b"-execute\n",)))
+        self._process.stdin.write(_command(params))
         self._process.stdin.flush()
-        output = b""
+        # Appending to a bytearray is amortised constant time, unlike
+        # repeated concatenation of bytes objects
+        output = bytearray()
+        pos = 0
         fd = self._process.stdout.fileno()
-        while not output[-32:].strip().endswith(sentinel):
-            output += os.read(fd, block_size)
-        return output.strip()[:-len(sentinel)]
+        try:
+            while True:
+                end, pos = _find_sentinel(output, 0, pos)
+                if end >= 0:
+                    break
+                output += _read_block(fd)
+        except BaseException:
+            # Don't leave unread output behind for the next command
+            self._restart()
+            raise
+        # Strip whitespace and the sentinel without copying the output
+        start = 0
+        while start < end and output[start:start + 1].isspace():
+            start += 1
+        return memoryview(output)[start:end]
+
+    def _execute_many(self, commands):
+        """Execute several batches of parameters with ``exiftool``.
+
+        The argument is a list of tuples of parameters, each of which
+        is processed like the parameters of :py:meth:`execute()`.  All
+        commands are written to ``exiftool`` at once by a separate
+        thread while this thread reads the output, so neither process
+        can block the other on a full pipe.  The return value is a list
+        with the output of each command as a ``memoryview``.
+        """
+        if not self.running:
+            raise ValueError("ExifTool instance not running.")
+        errors = []
+
+        def write():
+            try:
+                self._process.stdin.write(
+                    b"".join(_command(params) for params in commands))
+                self._process.stdin.flush()
+            except Exception as e:
+                errors.append(e)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        outputs = []
+        output = bytearray()
+        begin = pos = 0
+        fd = self._process.stdout.fileno()
+        try:
+            while len(outputs) < len(commands):
+                end, pos = _find_sentinel(output, begin, pos)
+                if end >= 0:
+                    outputs.append(
+                        memoryview(bytes(output[begin:end]).strip()))
+                    begin = pos
+                    continue
+                # Drop the outputs already split off before reading more
+                del output[:begin]
+                pos -= begin
+                begin = 0
+                output += _read_block(fd)
+        except BaseException:
+            # Kill exiftool, so the writer can't block on a full pipe,
+            # and replace it, so unread output can't be mistaken for the
+            # output of the next command
+            self._process.kill()
+            writer.join()
+            self._restart()
+            raise
+        writer.join()
+        if errors:
+            raise errors[0]
+        return outputs
+
+    def _restart(self):
+        """Replace the ``exiftool`` process with a new one.
+
+        The old process is killed without waiting for pending output.
+        """
+        process = self._process
+        del self._process
+        self.running = False
+        try:
+            process.kill()
+        except OSError:
+            pass
+        process.communicate()
+        self.start()
 
     def execute_json(self, *params):
         """Execute the given batch of parameters and parse the JSON output.
@@ -246,28 +574,209 @@ class ExifTool(object):
         system's filesystem encoding.  This behaviour means you can
         pass in filenames according to the convention of the
         respective Python version – as raw strings in Python 2.x and
-        as Unicode strings in Python 3.x.
+        as Unicode strings in Python 3.x.  In Python 3.6 and later,
+        path-like objects such as ``pathlib.Path`` are accepted as well.
+
+        If ``exiftool`` doesn't produce any output, e.g. because none
+        of the given files exist, ``None`` is returned.
         """
         params = map(fsencode, params)
-        return json.loads(self.execute(b"-j", *params).decode("utf-8"))
+        output = self._execute(b"-j", *params)
+        if not output:
+            return None
+        return _json_loads(output)
+
+    def _execute_json_files(self, params, filenames):
+        """Run :py:meth:`execute_json()` for the given files.
+
+        The first argument is a tuple of encoded parameters, which are
+        passed before the file names.  If result caching is enabled,
+        results are cached per file, and ``exiftool`` is only run for
+        the files that are not in the cache or have been modified since
+        their result was stored.
+
+        Batches of more than ``batch_size`` files are split into
+        several ``exiftool`` commands, so that only the output for one
+        part needs to be held in memory before it is parsed.
+        """
+        filenames = tuple(filenames)
+        if self._cache is None:
+            return self._execute_json_split(params, filenames)
+        if not self.running:
+            raise ValueError("ExifTool instance not running.")
+        cache = self._cache
+        # Entries are keyed on absolute paths, resolved against the
+        # working directory of exiftool rather than the current one
+        paths = {}
+        misses = []
+        for f in filenames:
+            if f in paths:
+                continue
+            path = os.path.normpath(os.path.join(self._cwd, fsencode(f)))
+            state = _file_state(path)
+            paths[f] = path, state
+            entry = cache.get((params, path))
+            if state is not None and (entry is None or entry[0] != state):
+                misses.append(f)
+        if misses:
+            result = self._execute_json_split(params, tuple(misses))
+            # Match the results to the files by name, since files that
+            # produced no output are missing
+            index = _index_by_source(result)
+            keys = set(_source_key(f) for f in misses)
+            if index is None or not all(k in keys for k in index):
+                # The output can't be matched to the files, so don't
+                # cache it
+                return self._execute_json_split(params, filenames)
+            for f in misses:
+                path, state = paths[f]
+                d = index.get(_source_key(f))
+                if d is None:
+                    cache.pop((params, path), None)
+                else:
+                    cache[params, path] = (state, d)
+        result = []
+        for f in filenames:
+            path, state = paths[f]
+            # exiftool produces no output for missing files
+            entry = cache.pop((params, path), None)
+            if state is None or entry is None:
+                continue
+            # Re-insert the entry as the most recently used one
+            cache[params, path] = entry
+            # Return copies, so callers can't modify the cached result
+            d = dict(entry[1])
+            # The entry may stem from a query naming the file differently
+            key = _source_key(f)
+            if _source_key(d.get("SourceFile", "")) != key:
+                d["SourceFile"] = key.decode("utf-8", "replace")
+            result.append(d)
+        while len(cache) > _cache_size:
+            cache.popitem(last=False)
+        return result or None
+
+    def _execute_json_file(self, params, filename):
+        """Run :py:meth:`_execute_json_files()` for a single file.
+
+        The dictionary for the file is returned.  ``ValueError`` is
+        raised if ``exiftool`` produced no output, e.g. because the
+        file doesn't exist.
+        """
+        result = self._execute_json_files(params, (filename,))
+        if not result:
+            raise ValueError("exiftool produced no output for '%s'"
+                             % (filename,))
+        return result[0]
+
+    def _execute_json_split(self, params, filenames):
+        """Run :py:meth:`execute_json()` in parts of ``batch_size`` files.
+
+        Both arguments are tuples.  The results are concatenated.
+
+        File names occurring more than once are only passed to
+        ``exiftool`` once, and the result is repeated for each
+        occurrence.
+        """
+        keys = [_source_key(f) for f in filenames]
+        unique = collections.OrderedDict()
+        for k, f in zip(keys, filenames):
+            unique.setdefault(k, f)
+        if len(unique) < len(filenames):
+            result = self._execute_json_split(params, tuple(unique.values()))
+            # The results are matched to the files by name, since files
+            # that produced no output are missing.  Only fall back to the
+            # full list if exiftool reported a name that wasn't given.
+            index = _index_by_source(result)
+            if index is not None and all(k in unique for k in index):
+                seen = set()
+                expanded = []
+                for k in keys:
+                    d = index.get(k)
+                    if d is None:
+                        continue
+                    if k in seen:
+                        d = dict(d)
+                    else:
+                        seen.add(k)
+                    expanded.append(d)
+                return expanded or None
+        if len(filenames) <= batch_size:
+            return self.execute_json(*params + filenames)
+        result = []
+        for i in range(0, len(filenames), batch_size):
+            part = filenames[i:i + batch_size]
+            result.extend(self.execute_json(*params + part) or ())
+        return result or None
 
-    def get_metadata_batch(self, filenames):
+    def get_metadata_batch(self, filenames, fast=0):
         """Return all meta-data for the given files.
 
         The return value will have the format described in the
         documentation of :py:meth:`execute_json()`.
+
+        If ``fast`` is non-zero, the ``exiftool`` option ``-fast`` or
+        ``-fast<fast>`` is passed, so ``exiftool`` only reads as much
+        of each file as needed for the more common meta-data.  This
+        can be much faster, in particular for large files, but some
+        information may be missing.  The levels are:
+
+        1. Stop reading JPEG files at the end of the image data, so
+           meta-data in trailers is missing.  Safe if you only need
+           the usual EXIF, IPTC and XMP information.
+        2. Additionally skip maker notes, so camera-specific tags are
+           missing.
+        3. Only return the file type and the pseudo tags from the
+           file system, like file name, size and dates.
+        4. Like 3, but determine the file type from the extension
+           without reading the file at all.
+        5. Like 4, and skip the Composite tags as well.
+
+        Levels above 2 need a recent version of ``exiftool``; see its
+        documentation for details.  ``ValueError`` is raised for
+        other values of ``fast``.
         """
-        return self.execute_json(*filenames)
+        _check_not_string(filenames, "filenames")
+        return self._execute_json_files(_fast_option(fast), filenames)
 
-    def get_metadata(self, filename):
+    def get_metadata(self, filename, fast=0):
         """Return meta-data for a single file.
 
+        Use :py:meth:`get_metadata_batch()` for many files; see there
+        for the meaning of ``fast``.
+
         The returned dictionary has the format described in the
-        documentation of :py:meth:`execute_json()`.
+        documentation of :py:meth:`execute_json()`.  ``ValueError`` is
+        raised if ``exiftool`` produces no output for the file, e.g.
+        because it doesn't exist.
         """
-        return self.execute_json(filename)[0]
+        return self._execute_json_file(_fast_option(fast), filename)
+
+    def get_metadata_from_bytes(self, data, fast=0):
+        """Return meta-data for a file given as a ``bytes`` object.
 
-    def get_tags_batch(self, tags, filenames):
+        This is useful for images that are already held in memory,
+        e.g. after downloading them.  Since the standard input of
+        ``exiftool`` is used for passing commands, the data is written
+        to a temporary file, which is created in the RAM-backed
+        ``/dev/shm`` if available, and removed afterwards.  Hence the
+        file names in the returned dictionary don't refer to an
+        existing file.  The result is never cached.
+
+        The meaning of ``fast`` and the format of the returned
+        dictionary are the same as for :py:meth:`get_metadata()`.
+        """
+        fd, path = tempfile.mkstemp(dir=_temp_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            result = self.execute_json(*_fast_option(fast) + (path,))
+        finally:
+            os.remove(path)
+        if not result:
+            raise ValueError("exiftool produced no output for the data")
+        return result[0]
+
+    def get_tags_batch(self, tags, filenames, fast=0):
         """Return only specified tags for the given files.
 
         The first argument is an iterable of tags.  The tag names may
@@ -276,50 +785,239 @@ class ExifTool(object):
         The second argument is an iterable of file names.
 
         The format of the return value is the same as for
-        :py:meth:`execute_json()`.
+        :py:meth:`execute_json()`.  The argument ``fast`` has the same
+        meaning as for :py:meth:`get_metadata_batch()`.
         """
-        # Explicitly ruling out strings here because passing in a
-        # string would lead to strange and hard-to-find errors
-        if isinstance(tags, basestring):
-            raise TypeError("The argument 'tags' must be "
-                            "an iterable of strings")
-        if isinstance(filenames, basestring):
-            raise TypeError("The argument 'filenames' must be "
-                            "an iterable of strings")
-        params = ["-" + t for t in tags]
-        params.extend(filenames)
-        return self.execute_json(*params)
-
-    def get_tags(self, tags, filename):
+        _check_not_string(tags, "tags")
+        _check_not_string(filenames, "filenames")
+        params = _fast_option(fast) + _tag_params(tags)
+        return self._execute_json_files(params, filenames)
+
+    def get_tags(self, tags, filename, fast=0):
         """Return only specified tags for a single file.
 
+        Use :py:meth:`get_tags_batch()` for many files; see
+        :py:meth:`get_metadata_batch()` for the meaning of ``fast``.
+
         The returned dictionary has the format described in the
-        documentation of :py:meth:`execute_json()`.
+        documentation of :py:meth:`execute_json()`.  ``ValueError`` is
+        raised if ``exiftool`` produces no output for the file, e.g.
+        because it doesn't exist.
         """
-        return self.get_tags_batch(tags, [filename])[0]
-
-    def get_tag_batch(self, tag, filenames):
+        _check_not_string(tags, "tags")
+        params = _fast_option(fast) + _tag_params(tags)
+        return self._execute_json_file(params, filename)
+
+    def get_tags_many(self, groups, fast=0):
+        """Return specified tags for several groups of files.
+
+        The argument ``groups`` is an iterable of pairs ``(tags,
+        filenames)``, each with the same meaning as the arguments of
+        :py:meth:`get_tags_batch()`.  All groups are sent to
+        ``exiftool`` in one go, which saves a round trip per group
+        compared to calling :py:meth:`get_tags_batch()` repeatedly.
+        This helps when different tags are needed for different files.
+
+        The return value is a list with one entry per group, in the
+        format returned by :py:meth:`get_tags_batch()`.  The meaning of
+        ``fast`` is described in :py:meth:`get_metadata_batch()`.
+        """
+        commands = []
+        for tags, filenames in groups:
+            _check_not_string(tags, "tags")
+            _check_not_string(filenames, "filenames")
+            params = (b"-j",) + _fast_option(fast) + _tag_params(tags)
+            commands.append(params + tuple(map(fsencode, filenames)))
+        return [_json_loads(output) if output else None
+                for output in self._execute_many(commands)]
+
+    def get_columns_batch(self, filenames, tags=None, fast=0):
+        """Return meta-data for the given files column by column.
+
+        This method returns the same information as
+        :py:meth:`get_metadata_batch()`, or as :py:meth:`get_tags_batch()`
+        if an iterable of ``tags`` is given, but as a dictionary
+        mapping each tag name to a list with one value per file.  The
+        list contains ``None`` for files lacking the tag.  The key
+        ``"SourceFile"`` maps to the list of file names.  This format
+        can be passed directly to ``pandas.DataFrame``, and is more
+        convenient when looking at a single tag across many files.
+
+        Files that ``exiftool`` couldn't read are omitted, as in the
+        other batch methods.  The meaning of ``fast`` is described in
+        :py:meth:`get_metadata_batch()`.
+        """
+        if tags is None:
+            data = self.get_metadata_batch(filenames, fast)
+        else:
+            data = self.get_tags_batch(tags, filenames, fast)
+        columns = {}
+        for i, d in enumerate(data or ()):
+            for k, v in d.items():
+                column = columns.get(k)
+                if column is None:
+                    column = columns[k] = [None] * len(data)
+                column[i] = v
+        return columns
+
+    def get_tag_batch(self, tag, filenames, fast=0):
         """Extract a single tag from the given files.
 
         The first argument is a single tag name, as usual in the
         format <group>:<tag>.
 
-        The second argument is an iterable of file names.
+        The second argument is an iterable of file names.  The meaning
+        of ``fast`` is described in :py:meth:`get_metadata_batch()`.
 
         The return value is a list of tag values or ``None`` for
         non-existent tags, in the same order as ``filenames``.
         """
-        data = self.get_tags_batch([tag], filenames)
-        result = []
-        for d in data:
-            d.pop("SourceFile")
-            result.append(next(iter(d.values()), None))
-        return result
+        data = self.get_tags_batch([tag], filenames, fast)
+        return [_tag_value(d, tag) for d in data or ()]
 
-    def get_tag(self, tag, filename):
+    def get_tag(self, tag, filename, fast=0):
         """Extract a single tag from a single file.
 
+        Use :py:meth:`get_tag_batch()` for many files; see
+        :py:meth:`get_metadata_batch()` for the meaning of ``fast``.
+
         The return value is the value of the specified tag, or
         ``None`` if this tag was not found in the file.
         """
-        return self.get_tag_batch(tag, [filename])[0]
+        return _tag_value(self.get_tags([tag], filename, fast), tag)
+
+class ExifToolPool(object):
+    """Run several ``exiftool`` processes and spread batches across them.
+
+    ``exiftool`` itself is single-threaded, so a single
+    :py:class:`ExifTool` instance uses at most one processor core.
+    This class manages a number of :py:class:`ExifTool` instances and
+    provides the batch methods of :py:class:`ExifTool`.  Each batch of
+    file names is split into contiguous parts, which are handed out to
+    the ``exiftool`` processes as they become idle, so that a few slow
+    files don't hold up the whole batch.  The results are returned in
+    the same order as for a single instance.
+
+    The number of processes defaults to the number of processor cores.
+    The second argument to the constructor is passed on to
+    :py:class:`ExifTool`.
+
+    The pool has to be started and terminated just like a single
+    :py:class:`ExifTool` instance, and it can be used as a context
+    manager in the same way::
+
+        with ExifToolPool() as pool:
+            metadata = pool.get_metadata_batch(files)
+
+    .. note:: An instance of this class must not be used from several
+       threads at the same time.
+
+    .. py:attribute:: workers
+
+       The list of :py:class:`ExifTool` instances of this pool.
+    """
+
+    def __init__(self, processes=None, executable_=None):
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        elif processes < 1:
+            raise ValueError("Number of processes must be at least 1")
+        self.workers = [ExifTool(executable_) for i in range(processes)]
+
+    @property
+    def running(self):
+        """A Boolean value indicating whether the processes are running."""
+        return all(worker.running for worker in self.workers)
+
+    def start(self):
+        """Start the ``exiftool`` processes of this pool.
+
+        See :py:meth:`ExifTool.start()`.
+        """
+        for worker in self.workers:
+            worker.start()
+
+    def terminate(self):
+        """Terminate the ``exiftool`` processes of this pool.
+
+        See :py:meth:`ExifTool.terminate()`.
+        """
+        for worker in self.workers:
+            worker.terminate()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.terminate()
+
+    def _map(self, method, args, filenames, **kwargs):
+        """Call the given method of the workers on parts of filenames.
+
+        The method is called with the positional arguments in args,
+        followed by a part of the list of file names, and the given
+        keyword arguments.  Each worker takes the next part as soon as
+        it is done with the previous one.  The lists returned by the
+        workers are concatenated in order; as for a single instance,
+        ``None`` is returned if no part produced any output.
+        """
+        _check_not_string(filenames, "filenames")
+        filenames = list(filenames)
+        if len(filenames) <= 1 or len(self.workers) == 1:
+            return getattr(self.workers[0], method)(*(args + (filenames,)),
+                                                    **kwargs)
+        # Use several parts per worker to balance the load, but keep
+        # them large enough to amortise the round trips to exiftool.
+        size = max(1, len(filenames) // (4 * len(self.workers)))
+        parts = [filenames[i:i + size]
+                 for i in range(0, len(filenames), size)]
+        results = [None] * len(parts)
+        errors = []
+        indices = iter(range(len(parts)))
+        lock = threading.Lock()
+
+        def run(worker):
+            while not errors:
+                with lock:
+                    i = next(indices, None)
+                if i is None:
+                    return
+                try:
+                    results[i] = getattr(worker, method)(
+                        *(args + (parts[i],)), **kwargs)
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(worker,))
+                   for worker in self.workers[:len(parts)]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        if all(r is None for r in results):
+            return None
+        return list(itertools.chain.from_iterable(r or () for r in results))
+
+    def get_metadata_batch(self, filenames, fast=0):
+        """Return all meta-data for the given files.
+
+        See :py:meth:`ExifTool.get_metadata_batch()`.
+        """
+        return self._map("get_metadata_batch", (), filenames, fast=fast)
+
+    def get_tags_batch(self, tags, filenames, fast=0):
+        """Return only specified tags for the given files.
+
+        See :py:meth:`ExifTool.get_tags_batch()`.
+        """
+        return self._map("get_tags_batch", (tags,), filenames, fast=fast)
+
+    def get_tag_batch(self, tag, filenames, fast=0):
+        """Extract a single tag from the given files.
+
+        See :py:meth:`ExifTool.get_tag_batch()`.
+        """
+        return self._map("get_tag_batch", (tag,), filenames, fast=fast)
@@ -5,7 +5,10 @@ from __future__ import unicode_literals
 import unittest
 import exiftool
 import warnings
+import weakref
 import os
+import shutil
+import tempfile
 
 class TestExifTool(unittest.TestCase):
     def setUp(self):
@@ -45,6 +48,8 @@ class TestExifTool(unittest.TestCase):
         self.process = self.et._process
         del self.et
         self.assertNotEqual(self.process.poll(), None)
+    def test_weakref(self):
+        self.assertIs(weakref.ref(self.et)(), self.et)
     def test_get_metadata(self):
         expected_data = [{"SourceFile": "rose.jpg",
                           "File:FileType": "JPEG",
@@ -81,6 +86,175 @@ class TestExifTool(unittest.TestCase):
         self.assertEqual(tags0, dict((k, expected_data[0][k])
                                      for k in ["SourceFile", "XMP:Subject"]))
         self.assertEqual(tag0, "Röschen")
+    def test_missing_file(self):
+        missing = os.path.join(os.path.dirname(__file__), "missing.jpg")
+        with self.et:
+            self.assertRaises(ValueError, self.et.get_metadata, missing)
+            self.assertRaises(ValueError, self.et.get_tag, "XMP:Subject",
+                              missing)
+            self.assertEqual(self.et.get_tag_batch("XMP:Subject", [missing]),
+                             [])
+    def test_get_columns_batch(self):
+        script_path = os.path.dirname(__file__)
+        source_files = [os.path.join(script_path, f)
+                        for f in ["rose.jpg", "skyblue.png"]]
+        with self.et:
+            columns = self.et.get_columns_batch(source_files,
+                                                ["XMP:Subject"])
+        self.assertEqual(columns["XMP:Subject"], ["Röschen", None])
+        self.assertEqual([os.path.normpath(f) for f in columns["SourceFile"]],
+                         source_files)
+    def test_cache_results(self):
+        script_path = os.path.dirname(__file__)
+        source_file = os.path.join(script_path, "rose.jpg")
+        self.et = exiftool.ExifTool(cache_results=True)
+        with self.et:
+            tags0 = self.et.get_tags(["XMP:Subject"], source_file)
+            tags0["XMP:Subject"] = None
+            tags1 = self.et.get_tags(["XMP:Subject"], source_file)
+            other_file = os.path.join(script_path, "skyblue.png")
+            data = self.et.get_tags_batch(["File:FileType"],
+                                          [other_file, source_file])
+            self.assertEqual(len(self.et._cache), 3)
+            self.et.clear_cache()
+            self.assertEqual(len(self.et._cache), 0)
+        self.assertEqual(tags1["XMP:Subject"], "Röschen")
+        self.assertEqual([d["File:FileType"] for d in data], ["PNG", "JPEG"])
+    def test_cache_relative_names(self):
+        # Relative names are resolved against the working directory of
+        # exiftool, which is fixed when it is started
+        script_path = os.path.abspath(os.path.dirname(__file__))
+        cwd = os.getcwd()
+        self.et = exiftool.ExifTool(cache_results=True)
+        os.chdir(script_path)
+        try:
+            self.et.start()
+            tags0 = self.et.get_tags(["XMP:Subject"], "rose.jpg")
+            os.chdir(os.path.dirname(script_path))
+            tags1 = self.et.get_tags(["XMP:Subject"], "rose.jpg")
+            self.et.terminate()
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(tags0["XMP:Subject"], "Röschen")
+        self.assertEqual(tags1, tags0)
+    def test_cache_source_file(self):
+        # Cached results report the file name as given in each query
+        source_file = os.path.relpath(
+            os.path.join(os.path.dirname(__file__), "rose.jpg"))
+        abs_file = os.path.abspath(source_file)
+        self.et = exiftool.ExifTool(cache_results=True)
+        with self.et:
+            tags0 = self.et.get_tags(["XMP:Subject"], source_file)
+            data = self.et.get_tags_batch(["XMP:Subject"], [abs_file])
+        self.assertEqual(tags0["SourceFile"], source_file)
+        self.assertEqual(data[0]["SourceFile"], abs_file)
+        self.assertEqual(data[0]["XMP:Subject"], "Röschen")
+    def test_get_metadata_from_bytes(self):
+        script_path = os.path.dirname(__file__)
+        with open(os.path.join(script_path, "rose.jpg"), "rb") as f:
+            data = f.read()
+        with self.et:
+            metadata = self.et.get_metadata_from_bytes(data)
+        self.assertEqual(metadata["File:FileType"], "JPEG")
+        self.assertEqual(metadata["XMP:Subject"], "Röschen")
+        self.assertFalse(os.path.exists(metadata["SourceFile"]))
+    def test_get_tags_many(self):
+        # A file name containing the sentinel must not end the output
+        # of a command early
+        script_path = os.path.dirname(__file__)
+        block_size = exiftool.block_size
+        temp_dir = tempfile.mkdtemp()
+        try:
+            ready = os.path.join(temp_dir, "{ready}.jpg")
+            shutil.copy(os.path.join(script_path, "rose.jpg"), ready)
+            skyblue = os.path.join(script_path, "skyblue.png")
+            # Reading single bytes makes a read end right after the
+            # sentinel in the file name
+            for exiftool.block_size in (1, block_size):
+                with self.et:
+                    data = self.et.get_tags_many(
+                        [(["File:FileType"], [ready]),
+                         (["File:FileType"], [skyblue]),
+                         (["File:FileType"], [])])
+                    tag = self.et.get_tag("XMP:Subject", ready)
+                    tag1 = self.et.get_tag("XMP:Subject", ready)
+                self.assertEqual(len(data), 3)
+                self.assertEqual(data[0][0]["File:FileType"], "JPEG")
+                self.assertEqual(data[0][0]["SourceFile"], ready)
+                self.assertEqual(data[1][0]["File:FileType"], "PNG")
+                self.assertIsNone(data[2])
+                self.assertEqual(tag, "Röschen")
+                self.assertEqual(tag1, "Röschen")
+        finally:
+            exiftool.block_size = block_size
+            shutil.rmtree(temp_dir)
+    def test_duplicate_files(self):
+        script_path = os.path.dirname(__file__)
+        rose = os.path.join(script_path, "rose.jpg")
+        skyblue = os.path.join(script_path, "skyblue.png")
+        missing = os.path.join(script_path, "missing.jpg")
+        with self.et:
+            data = self.et.get_tags_batch(["File:FileType"],
+                                          [rose, skyblue, rose])
+            data1 = self.et.get_tags_batch(["File:FileType"],
+                                           [rose, missing, skyblue, missing,
+                                            rose])
+        self.assertEqual([d["File:FileType"] for d in data],
+                         ["JPEG", "PNG", "JPEG"])
+        self.assertIsNot(data[0], data[2])
+        self.assertEqual([d["File:FileType"] for d in data1],
+                         ["JPEG", "PNG", "JPEG"])
+        if os.altsep:
+            return
+        # Outside Windows, "a\\b.jpg" and "a/b.jpg" are different files
+        temp_dir = tempfile.mkdtemp()
+        try:
+            os.mkdir(os.path.join(temp_dir, "a"))
+            slash = os.path.join(temp_dir, "a", "b.jpg")
+            backslash = os.path.join(temp_dir, "a\\b.jpg")
+            shutil.copy(rose, slash)
+            shutil.copy(skyblue, backslash)
+            with self.et:
+                data2 = self.et.get_tags_batch(["File:FileType"],
+                                               [slash, backslash, slash])
+        finally:
+            shutil.rmtree(temp_dir)
+        self.assertEqual([d["File:FileType"] for d in data2],
+                         ["JPEG", "PNG", "JPEG"])
+    @unittest.skipIf(not hasattr(os, "fspath"), "requires os.fspath()")
+    def test_path_objects(self):
+        import pathlib
+        source_file = pathlib.Path(os.path.dirname(__file__)) / "rose.jpg"
+        with self.et:
+            tag = self.et.get_tag("XMP:Subject", source_file)
+        self.assertEqual(tag, "Röschen")
+
+class TestExifToolPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = exiftool.ExifToolPool(2)
+    def tearDown(self):
+        self.pool.terminate()
+    def test_batch_order(self):
+        # Test that results are returned in the order of the files
+        # even though they are spread across several processes
+        script_path = os.path.dirname(__file__)
+        source_files = [os.path.join(script_path, f)
+                        for f in ["rose.jpg", "skyblue.png", "rose.jpg"]]
+        self.assertFalse(self.pool.running)
+        with self.pool:
+            self.assertTrue(self.pool.running)
+            metadata = self.pool.get_metadata_batch(source_files)
+            tags = self.pool.get_tag_batch("XMP:Subject", source_files)
+        self.assertFalse(self.pool.running)
+        self.assertEqual([os.path.normpath(d["SourceFile"]) for d in metadata],
+                         source_files)
+        self.assertEqual(tags, ["Röschen", None, "Röschen"])
+    def test_missing_files(self):
+        missing = os.path.join(os.path.dirname(__file__), "missing.jpg")
+        with self.pool:
+            self.assertIsNone(self.pool.get_metadata_batch([missing]))
+            self.assertIsNone(self.pool.get_metadata_batch([missing] * 3))
+        self.assertRaises(ValueError, exiftool.ExifToolPool, 0)
 
 if __name__ == '__main__':
     unittest.main()